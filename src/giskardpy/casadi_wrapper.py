@@ -21,7 +21,7 @@ def diag(*args):
 
 
 def Symbol(data):
-    if isinstance(data, str) or isinstance(data, unicode):
+    if isinstance(data, (str, unicode)):
         return ca.SX.sym(data)
     return ca.SX(data)
 
@@ -91,10 +91,11 @@ def Matrix(data):
             m = ca.SX(*data.shape)
         else:
             x = len(data)
-            if isinstance(data[0], list) or isinstance(data[0], tuple):
+            if isinstance(data[0], (list, tuple)):
                 y = len(data[0])
             else:
-                y = 1
+                # a column of expressions, stacking them at once is much faster than assigning each entry
+                return ca.vertcat(*data)
             m = ca.SX(x, y)
         for i in range(m.shape[0]):
             if y > 1:
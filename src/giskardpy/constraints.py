@@ -29,6 +29,8 @@ WEIGHT_COLLISION_AVOIDANCE = Constraint_msg.WEIGHT_COLLISION_AVOIDANCE
 WEIGHT_BELOW_CA = Constraint_msg.WEIGHT_BELOW_CA
 WEIGHT_MIN = Constraint_msg.WEIGHT_MIN
 
+ALMOST_IDENTITY_ROTATION = w.rotation_matrix_from_axis_angle([0, 0, 1], 0.0001)
+
 
 class Constraint(object):
     def __init__(self, god_map, **kwargs):
@@ -427,8 +429,8 @@ class Constraint(object):
         root_R_tipCurrent = w.rotation_of(self.get_fk(root, tip))
         root_R_tipCurrent_evaluated = w.rotation_of(self.get_fk_evaluated(root, tip))
 
-        identity = w.rotation_matrix_from_axis_angle([0, 0, 1], 0.0001)
-        tipCurrentEvaluated_R_tipCurrent = w.dot(w.dot(root_R_tipCurrent_evaluated.T, identity), root_R_tipCurrent)
+        tipCurrentEvaluated_R_tipCurrent = w.dot(w.dot(root_R_tipCurrent_evaluated.T, ALMOST_IDENTITY_ROTATION),
+                                                 root_R_tipCurrent)
         current_axis, current_angle = w.axis_angle_from_matrix(tipCurrentEvaluated_R_tipCurrent)
         current_angle_axis = (current_axis * current_angle)
 
@@ -2135,7 +2137,8 @@ class OpenDoor(Constraint):
         root_T_handleGoal = root_T_hinge0 * kdl.Frame(
             kdl.Rotation().Rot(hinge_V_hinge_axis, angle_goal)) * hinge_T_handle
 
-        handleStart_T_tipStart = tf.msg_to_kdl(tf.lookup_pose(handle_frame_id, self.tip))
+        # handle and tip are already known relative to the hinge, no need for another tf lookup
+        handleStart_T_tipStart = hinge_T_handle.Inverse() * hingeStart_T_tipStart
         root_T_tipGoal = tf.kdl_to_np(root_T_handleGoal * handleStart_T_tipStart)
 
         hinge0_T_tipGoal = tf.kdl_to_np(hingeStart_T_tipStart)
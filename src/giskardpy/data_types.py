@@ -38,7 +38,7 @@ class Trajectory(object):
         pass
 
     def set(self, time, point):
-        if len(self._points) > 0 and self._points.keys()[-1] > time:
+        if len(self._points) > 0 and next(reversed(self._points)) > time:
             raise KeyError(u'Cannot append a trajectory point that is before the current end time of the trajectory.')
         self._points[time] = point
 
@@ -46,7 +46,7 @@ class Trajectory(object):
         del self._points[time]
 
     def delete_last(self):
-        self.delete(self._points.keys()[-1])
+        self.delete(next(reversed(self._points)))
 
     def items(self):
         return self._points.items()
@@ -247,7 +247,7 @@ class GodMap(object):
         :return: the symbol corresponding to the identifier
         :rtype: sw.Symbol
         """
-        assert isinstance(identifier, list) or isinstance(identifier, tuple)
+        assert isinstance(identifier, (list, tuple))
         identifier = tuple(identifier)
         identifier_parts = identifier
         if identifier not in self.key_to_expr:
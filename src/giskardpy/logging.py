@@ -1,7 +1,14 @@
+from __future__ import absolute_import
+
+import logging as python_logging
+
 import rospy
 from inspect import currentframe, getframeinfo
 from giskardpy import identifier
 
+# rospy.logdebug logs to this logger
+rosout_logger = python_logging.getLogger(u'rosout')
+
 
 def debug():
     try:
@@ -39,6 +46,9 @@ def generate_msg(msg):
 
 
 def logdebug(msg):
+    if not rosout_logger.isEnabledFor(python_logging.DEBUG):
+        # generate_debug_msg inspects the call stack, skip it if the message would be dropped anyway
+        return
     final_msg = generate_debug_msg(msg)
     rospy.logdebug(final_msg)
 
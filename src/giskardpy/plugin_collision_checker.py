@@ -1,6 +1,6 @@
 import itertools
 from collections import defaultdict
-from copy import deepcopy
+from copy import copy
 from multiprocessing import Lock
 
 import rospy
@@ -51,8 +51,10 @@ class CollisionChecker(GiskardBehavior):
 
         max_distances = defaultdict(lambda: default_distance)
 
-        for link_name in self.get_robot().get_links_with_collision():
-            controlled_parent_joint = self.get_robot().get_controlled_parent_joint(link_name)
+        # many links share the same controlled parent joint, its child links only have to be visited once
+        controlled_parent_joints = {self.get_robot().get_controlled_parent_joint(link_name)
+                                    for link_name in self.get_robot().get_links_with_collision()}
+        for controlled_parent_joint in controlled_parent_joints:
             distance = external_distances[controlled_parent_joint][u'soft_threshold']
             for child_link_name in self.get_robot().get_directly_controllable_collision_links(controlled_parent_joint):
                 max_distances[child_link_name] = distance
@@ -73,7 +75,9 @@ class CollisionChecker(GiskardBehavior):
 
 
 
-        self.collision_matrix = self.get_world().collision_goals_to_collision_matrix(deepcopy(collision_goals), max_distances)
+        # verify_collision_entries only reassigns fields of the entries, shallow copies are enough to protect the goal
+        collision_goals = [copy(collision_entry) for collision_entry in collision_goals]
+        self.collision_matrix = self.get_world().collision_goals_to_collision_matrix(collision_goals, max_distances)
 
         self.collision_list_size = self.get_god_map().get_data(identifier.external_collision_avoidance_repeller)
         self.collision_list_size = max(self.collision_list_size,
@@ -1,4 +1,4 @@
-from Queue import Empty, Queue
+from threading import Event
 from time import time
 
 import rospy
@@ -25,28 +25,24 @@ class ConfigurationPlugin(GiskardBehavior):
         self.mjs = None
         self.map_frame = self.get_god_map().get_data(identifier.map_frame)
         self.joint_state_topic = joint_state_topic
-        self.lock = Queue(maxsize=1)
+        self.latest_js = None
+        self.new_js = Event()
 
     def setup(self, timeout=0.0):
         self.joint_state_sub = rospy.Subscriber(self.joint_state_topic, JointState, self.cb, queue_size=1)
         return super(ConfigurationPlugin, self).setup(timeout)
 
     def cb(self, data):
-        try:
-            self.lock.get_nowait()
-        except Empty:
-            pass
-        self.lock.put(data)
+        self.latest_js = data
+        self.new_js.set()
 
     def update(self):
-        try:
-            if self.mjs is None:
-                js = self.lock.get()
-            else:
-                js = self.lock.get_nowait()
-            self.mjs = to_joint_state_dict(js)
-        except Empty:
-            pass
+        if self.mjs is None:
+            self.new_js.wait()
+        if self.new_js.is_set():
+            # clear before reading, a message that arrives in between is picked up in the next tick
+            self.new_js.clear()
+            self.mjs = to_joint_state_dict(self.latest_js)
 
         robot_frame = self.get_robot().get_root()
         base_pose = lookup_pose(self.map_frame, robot_frame)
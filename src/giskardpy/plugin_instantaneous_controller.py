@@ -38,7 +38,8 @@ class ControllerPlugin(GiskardBehavior):
 
         # update = False
         # if self.soft_constraints is None or set(self.soft_constraints.keys()) != set(new_soft_constraints.keys()):
-        self.soft_constraints = copy(new_soft_constraints)
+        # InstantaneousController.update_constraints copies the soft constraints into its own dict
+        self.soft_constraints = new_soft_constraints
             # update = True
 
         # if self.joint_constraints is None or set(self.joint_constraints.keys()) != set(new_joint_constraints.keys()):
@@ -9,6 +9,7 @@ from giskard_msgs.srv import UpdateWorld, UpdateWorldResponse, UpdateWorldReques
     GetAttachedObjects, GetAttachedObjectsResponse
 from py_trees import Status
 from sensor_msgs.msg import JointState
+from std_msgs.msg import Header
 from std_srvs.srv import Trigger, TriggerResponse
 from visualization_msgs.msg import Marker, MarkerArray
 
@@ -179,11 +180,12 @@ class WorldUpdatePlugin(GiskardBehavior):
                 res.joint_state_topic = self.object_js_subs[req.object_name].name
             res.pose.pose = object.base_pose
             res.pose.header.frame_id = self.get_god_map().get_data(identifier.map_frame)
-            for key, value in object.joint_state.items():
-                res.joint_state.name.append(key)
-                res.joint_state.position.append(value.position)
-                res.joint_state.velocity.append(value.velocity)
-                res.joint_state.effort.append(value.effort)
+            joint_state = object.joint_state
+            res.joint_state.name = list(joint_state.keys())
+            single_joint_states = list(joint_state.values())
+            res.joint_state.position = [x.position for x in single_joint_states]
+            res.joint_state.velocity = [x.velocity for x in single_joint_states]
+            res.joint_state.effort = [x.effort for x in single_joint_states]
         except KeyError as e:
             logging.logerr('no object with the name {} was found'.format(req.object_name))
             res.error_codes = GetObjectInfoResponse.NAME_NOT_FOUND_ERROR
@@ -304,12 +306,13 @@ class WorldUpdatePlugin(GiskardBehavior):
         world_object = WorldObject.from_world_body(world_body)
         self.unsafe_get_world().add_object(world_object)
         self.unsafe_get_world().set_object_pose(world_body.name, global_pose)
-        try:
-            m = self.unsafe_get_world().get_object(world_body.name).as_marker_msg()
-            m.header.frame_id = self.map_frame
-            self.publish_object_as_marker(m)
-        except:
-            pass
+        if self.has_marker_subscribers():
+            try:
+                m = self.unsafe_get_world().get_object(world_body.name).as_marker_msg()
+                m.header.frame_id = self.map_frame
+                self.publish_object_as_marker(m)
+            except:
+                pass
         # SUB-CASE: If it is an articulated object, open up a joint state subscriber
         # FIXME also keep track of base pose
         if world_body.joint_state_topic:
@@ -321,12 +324,13 @@ class WorldUpdatePlugin(GiskardBehavior):
     def detach_object(self, req):
         # assumes that parent has god map lock
         self.unsafe_get_world().detach(req.body.name)
-        try:
-            m = self.unsafe_get_world().get_object(req.body.name).as_marker_msg()
-            m.header.frame_id = self.map_frame
-            self.publish_object_as_marker(m)
-        except:
-            pass
+        if self.has_marker_subscribers():
+            try:
+                m = self.unsafe_get_world().get_object(req.body.name).as_marker_msg()
+                m.header.frame_id = self.map_frame
+                self.publish_object_as_marker(m)
+            except:
+                pass
 
     def attach_object(self, req):
         """
@@ -340,32 +344,35 @@ class WorldUpdatePlugin(GiskardBehavior):
             p = transform_pose(req.pose.header.frame_id, p)
             world_object = self.unsafe_get_world().get_object(req.body.name)
             self.unsafe_get_world().attach_existing_obj_to_robot(req.body.name, req.pose.header.frame_id, p.pose)
-            m = world_object.as_marker_msg()
-            m.header.frame_id = p.header.frame_id
-            m.pose = p.pose
+            marker_header = Header(frame_id=p.header.frame_id)
+            marker_pose = p.pose
         else:
             world_object = WorldObject.from_world_body(req.body)
             self.unsafe_get_world().robot.attach_urdf_object(world_object,
                                                       req.pose.header.frame_id,
                                                       req.pose.pose)
             logging.loginfo(u'--> attached object {} on link {}'.format(req.body.name, req.pose.header.frame_id))
-            m = world_object.as_marker_msg()
-            m.pose = req.pose.pose
-            m.header = req.pose.header
-        try:
-            m.frame_locked = True
-            self.publish_object_as_marker(m)
-        except:
-            pass
+            marker_header = req.pose.header
+            marker_pose = req.pose.pose
+        if self.has_marker_subscribers():
+            try:
+                m = world_object.as_marker_msg()
+                m.header = marker_header
+                m.pose = marker_pose
+                m.frame_locked = True
+                self.publish_object_as_marker(m)
+            except:
+                pass
 
     def remove_object(self, name):
         # assumes that parent has god map lock
-        try:
-            m = self.unsafe_get_world().get_object(name).as_marker_msg()
-            m.action = m.DELETE
-            self.publish_object_as_marker(m)
-        except:
-            pass
+        if self.has_marker_subscribers():
+            try:
+                m = self.unsafe_get_world().get_object(name).as_marker_msg()
+                m.action = m.DELETE
+                self.publish_object_as_marker(m)
+            except:
+                pass
         self.unsafe_get_world().remove_object(name)
         if name in self.object_js_subs:
             self.object_js_subs[name].unregister()
@@ -384,9 +391,17 @@ class WorldUpdatePlugin(GiskardBehavior):
         self.object_js_subs = {}
         self.object_joint_states = {}
 
+    def has_marker_subscribers(self):
+        """
+        The marker publisher isn't latched, markers published without subscribers are lost.
+        Callers check this before building the marker.
+        :rtype: bool
+        """
+        return self.pub_collision_marker.get_num_connections() > 0
+
     def publish_object_as_marker(self, m):
         """
-        :type object_: WorldObject
+        :type m: Marker
         """
         try:
             ma = MarkerArray()
@@ -397,4 +412,5 @@ class WorldUpdatePlugin(GiskardBehavior):
             pass
 
     def delete_markers(self):
-        self.pub_collision_marker.publish(MarkerArray([Marker(action=Marker.DELETEALL)]))
+        if self.has_marker_subscribers():
+            self.pub_collision_marker.publish(MarkerArray([Marker(action=Marker.DELETEALL)]))
@@ -197,7 +197,7 @@ class GoalToConstraints(GetGoal):
             self.add_self_collision_avoidance_constraints()
 
     def add_external_collision_avoidance_constraints(self, soft_threshold_override=None):
-        soft_constraints = {}
+        num_external = 0
         number_of_repeller = self.get_god_map().get_data(identifier.external_collision_avoidance_repeller)
         number_of_repeller_eef = self.get_god_map().get_data(identifier.external_collision_avoidance_repeller_eef)
         eef_joints = self.get_robot().get_controlled_leaf_joints()
@@ -208,51 +208,56 @@ class GoalToConstraints(GetGoal):
         for joint_name in remaining_joints:
             child_links = self.get_robot().get_directly_controllable_collision_links(joint_name)
             if child_links:
-                for i in range(number_of_repeller):
-                    child_link = self.get_robot().get_child_link_of_joint(joint_name)
-                    hard_threshold = self.get_god_map().get_data(identifier.external_collision_avoidance_distance +
-                                                                [joint_name, u'hard_threshold'])
-                    if soft_threshold_override is not None:
-                        soft_threshold = soft_threshold_override
-                    else:
-                        soft_threshold = self.get_god_map().get_data(identifier.external_collision_avoidance_distance +
-                                                                    [joint_name, u'soft_threshold'])
+                child_link = self.get_robot().get_child_link_of_joint(joint_name)
+                hard_threshold = self.get_god_map().get_data(identifier.external_collision_avoidance_distance +
+                                                            [joint_name, u'hard_threshold'])
+                if soft_threshold_override is not None:
+                    soft_threshold = soft_threshold_override
+                else:
+                    soft_threshold = self.get_god_map().get_data(identifier.external_collision_avoidance_distance +
+                                                                [joint_name, u'soft_threshold'])
+                if number_of_repeller > 0:
                     maximum_distance = max(maximum_distance, soft_threshold)
+                for i in range(number_of_repeller):
                     constraint = ExternalCollisionAvoidance(self.god_map, child_link,
                                                             hard_threshold=hard_threshold,
                                                             soft_threshold=soft_threshold,
                                                             idx=i,
                                                             num_repeller=number_of_repeller)
-                    soft_constraints.update(constraint.get_constraints())
+                    constraints = constraint.get_constraints()
+                    num_external += len(constraints)
+                    self.soft_constraints.update(constraints)
 
         for joint_name in eef_joints:
             child_link = self.get_robot().get_child_link_of_joint(joint_name)
-            for i in range(number_of_repeller_eef):
-                hard_threshold = self.get_god_map().get_data(identifier.external_collision_avoidance_distance +
-                                                             [joint_name, u'hard_threshold'])
-                if soft_threshold_override is not None:
-                    soft_threshold = soft_threshold_override
-                else:
-                    soft_threshold = self.get_god_map().get_data(identifier.external_collision_avoidance_distance +
-                                                                 [joint_name, u'soft_threshold'])
+            hard_threshold = self.get_god_map().get_data(identifier.external_collision_avoidance_distance +
+                                                         [joint_name, u'hard_threshold'])
+            if soft_threshold_override is not None:
+                soft_threshold = soft_threshold_override
+            else:
+                soft_threshold = self.get_god_map().get_data(identifier.external_collision_avoidance_distance +
+                                                             [joint_name, u'soft_threshold'])
+            if number_of_repeller_eef > 0:
                 maximum_distance = max(maximum_distance, soft_threshold)
+            for i in range(number_of_repeller_eef):
                 constraint = ExternalCollisionAvoidance(self.god_map, child_link,
                                                         hard_threshold=hard_threshold,
                                                         soft_threshold=soft_threshold,
                                                         idx=i,
                                                         num_repeller=number_of_repeller_eef)
-                soft_constraints.update(constraint.get_constraints())
+                constraints = constraint.get_constraints()
+                num_external += len(constraints)
+                self.soft_constraints.update(constraints)
 
-        num_external = len(soft_constraints)
         loginfo('adding {} external collision avoidance constraints'.format(num_external))
-        self.soft_constraints.update(soft_constraints)
         self.get_god_map().set_data(identifier.maximum_collision_threshold, maximum_distance)
 
     def add_self_collision_avoidance_constraints(self):
         counter = defaultdict(int)
-        soft_constraints = {}
+        num_self = 0
         number_of_repeller = self.get_god_map().get_data(identifier.self_collision_avoidance_repeller)
         maximum_distance = self.get_god_map().get_data(identifier.maximum_collision_threshold)
+        thresholds = self.get_god_map().get_data(identifier.self_collision_avoidance_distance)
         for link_a_o, link_b_o in self.get_robot().get_self_collision_matrix():
             link_a, link_b = self.robot.get_chain_reduced_to_controlled_joints(link_a_o, link_b_o)
             if not self.get_robot().link_order(link_a, link_b):
@@ -262,15 +267,12 @@ class GoalToConstraints(GetGoal):
         for link_a, link_b in counter:
             num_of_constraints = min(1, counter[link_a, link_b])
             for i in range(num_of_constraints):
-                thresholds = self.get_god_map().get_data(identifier.self_collision_avoidance_distance)
-                key = u'{}, {}'.format(link_a, link_b)
-                key_r = u'{}, {}'.format(link_b, link_a)
-                if key in thresholds:
-                    hard_threshold = thresholds[key][u'hard_threshold']
-                    soft_threshold = thresholds[key][u'soft_threshold']
-                elif key_r in thresholds:
-                    hard_threshold = thresholds[key_r][u'hard_threshold']
-                    soft_threshold = thresholds[key_r][u'soft_threshold']
+                pair_thresholds = thresholds.get(u'{}, {}'.format(link_a, link_b))
+                if pair_thresholds is None:
+                    pair_thresholds = thresholds.get(u'{}, {}'.format(link_b, link_a))
+                if pair_thresholds is not None:
+                    hard_threshold = pair_thresholds[u'hard_threshold']
+                    soft_threshold = pair_thresholds[u'soft_threshold']
                 else:
                     # TODO minimum is not the best if i reduce to the links next to the controlled chains
                     #   should probably add symbols that retrieve the values for the current pair
@@ -286,7 +288,8 @@ class GoalToConstraints(GetGoal):
                                                     soft_threshold=soft_threshold,
                                                     idx=i,
                                                     num_repeller=number_of_repeller)
-                soft_constraints.update(constraint.get_constraints())
-        loginfo('adding {} self collision avoidance constraints'.format(len(soft_constraints)))
-        self.soft_constraints.update(soft_constraints)
+                constraints = constraint.get_constraints()
+                num_self += len(constraints)
+                self.soft_constraints.update(constraints)
+        loginfo('adding {} self collision avoidance constraints'.format(num_self))
         self.get_god_map().set_data(identifier.maximum_collision_threshold, maximum_distance)
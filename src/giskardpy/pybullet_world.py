@@ -51,30 +51,28 @@ class PyBulletWorld(World):
         """
         collisions = Collisions(self.robot, collision_list_size)
         robot_name = self.robot.get_name()
+        robot_id = self.robot.get_pybullet_id()
         for (robot_link, body_b, link_b), distance in cut_off_distances.items():
             if robot_name == body_b:
-                object_id = self.robot.get_pybullet_id()
+                body_b_object = self.robot
+                object_id = robot_id
                 link_b_id = self.robot.get_pybullet_link_id(link_b)
             else:
-                object_id = self.__get_pybullet_object_id(body_b)
+                body_b_object = self.get_object(body_b)
+                object_id = body_b_object.get_pybullet_id()
                 if link_b != CollisionEntry.ALL:
-                    link_b_id = self.get_object(body_b).get_pybullet_link_id(link_b)
+                    link_b_id = body_b_object.get_pybullet_link_id(link_b)
 
             robot_link_id = self.robot.get_pybullet_link_id(robot_link)
             if body_b == robot_name or link_b != CollisionEntry.ALL:
-                contacts = [ContactInfo(*x) for x in p.getClosestPoints(self.robot.get_pybullet_id(), object_id,
+                contacts = [ContactInfo(*x) for x in p.getClosestPoints(robot_id, object_id,
                                                                         distance * 1.1,
                                                                         robot_link_id, link_b_id)]
             else:
-                contacts = [ContactInfo(*x) for x in p.getClosestPoints(self.robot.get_pybullet_id(), object_id,
+                contacts = [ContactInfo(*x) for x in p.getClosestPoints(robot_id, object_id,
                                                                         distance * 1.1,
                                                                         robot_link_id)]
             if len(contacts) > 0:
-                try:
-                    body_b_object = self.get_object(body_b)
-                except KeyError:
-                    body_b_object = self.robot
-                pass
                 for contact in contacts:  # type: ContactInfo
                     if link_b == CollisionEntry.ALL:
                         link_b_tmp = body_b_object.pybullet_link_id_to_name(contact.link_index_b)
@@ -1,6 +1,7 @@
 from collections import OrderedDict
 from multiprocessing import Lock
 
+import numpy as np
 import pybullet as p
 import giskardpy.pybullet_wrapper as pw
 from geometry_msgs.msg import Pose
@@ -29,6 +30,7 @@ class PyBulletWorldObject(WorldObject):
         :type path_to_data_folder: str
         """
         self._pybullet_id = None
+        self._pybullet_urdf = None
         self.mimic_cb = {}
         self.lock = Lock()
         super(PyBulletWorldObject, self).__init__(urdf,
@@ -56,17 +58,11 @@ class PyBulletWorldObject(WorldObject):
         with self.lock:
             WorldObject.joint_state.fset(self, value)
             for joint_name, singe_joint_state in value.items():
-                # FIXME hack because pybullet doesn't support mimic joints
-                if not self.is_joint_mimic(joint_name):
-                    p.resetJointState(self._pybullet_id, self.joint_name_to_info[joint_name].joint_index,
-                                      singe_joint_state.position)
-                if joint_name in self.mimic_cb:
-                    mimic_joint, cb = self.mimic_cb[joint_name]
-                    mimiced_position = cb(singe_joint_state.position)
-                    p.resetJointState(self._pybullet_id, self.joint_name_to_info[mimic_joint].joint_index,
-                                      mimiced_position)
-                else:
-                    pass
+                for joint_index, cb in self.joint_name_to_reset_targets[joint_name]:
+                    if cb is None:
+                        p.resetJointState(self._pybullet_id, joint_index, singe_joint_state.position)
+                    else:
+                        p.resetJointState(self._pybullet_id, joint_index, cb(singe_joint_state.position))
 
 
     @WorldObject.base_pose.setter
@@ -119,10 +115,27 @@ class PyBulletWorldObject(WorldObject):
                 self.mimic_cb[self.get_mimiced_joint_name(joint_info.joint_name)] = joint_name, apply_mimic(offset, multiplier)
         self.link_name_to_id[self.get_root()] = -1
         self.link_id_to_name[-1] = self.get_root()
+        # pybullet joint indices that have to be reset when a joint state arrives, (joint_index, mimic_cb or None)
+        self.joint_name_to_reset_targets = {}
+        for joint_name, joint_info in self.joint_name_to_info.items():
+            if joint_info.joint_index == -1:
+                continue
+            targets = []
+            # FIXME hack because pybullet doesn't support mimic joints
+            if not self.is_joint_mimic(joint_name):
+                targets.append((joint_info.joint_index, None))
+            if joint_name in self.mimic_cb:
+                mimic_joint, cb = self.mimic_cb[joint_name]
+                targets.append((self.joint_name_to_info[mimic_joint].joint_index, cb))
+            self.joint_name_to_reset_targets[joint_name] = targets
 
     def reinitialize(self):
         with self.lock:
             super(PyBulletWorldObject, self).reinitialize()
+            urdf = self.get_urdf_str()
+            if self._pybullet_id is not None and urdf == self._pybullet_urdf:
+                # the body in bullet is still up to date, no need to load it again
+                return
             deactivate_rendering()
             joint_state = None
             base_pose = None
@@ -130,10 +143,11 @@ class PyBulletWorldObject(WorldObject):
                 joint_state = self.joint_state
                 base_pose = self.base_pose
                 self.suicide()
-            self._pybullet_id = load_urdf_string_into_bullet(self.get_urdf_str(), base_pose)
+            self._pybullet_id = load_urdf_string_into_bullet(urdf, base_pose)
+            self._pybullet_urdf = urdf
             self.__sync_with_bullet()
         if joint_state is not None:
-            joint_state = {k: v for k, v in joint_state.items() if k in self.get_joint_names()}
+            joint_state = {k: v for k, v in joint_state.items() if k in self._urdf_robot.joint_map}
             self.joint_state = joint_state
         activate_rendering()
 
@@ -164,6 +178,43 @@ class PyBulletWorldObject(WorldObject):
     def pybullet_link_id_to_name(self, link_id):
         return self.link_id_to_name[link_id]
 
+    def get_pybullet_link_aabb(self, link_name):
+        """
+        :type link_name: str
+        :return: axis aligned bounding box of link_name in the current joint state as (aabb_min, aabb_max)
+        :rtype: tuple
+        """
+        return p.getAABB(self._pybullet_id, self.get_pybullet_link_id(link_name))
+
+    def check_collisions(self, link_combinations, distance):
+        """
+        Only asks pybullet for closest points, if the bounding boxes of both links are closer than distance.
+        """
+        in_collision = set()
+        link_combinations = list(link_combinations)
+        if not link_combinations:
+            return in_collision
+        link_to_index = {}
+        for link_pair in link_combinations:
+            for link_name in link_pair:
+                if link_name not in link_to_index:
+                    link_to_index[link_name] = len(link_to_index)
+        aabbs = np.empty((len(link_to_index), 2, 3))
+        link_ids = [None] * len(link_to_index)
+        for link_name, i in link_to_index.items():
+            link_ids[i] = self.get_pybullet_link_id(link_name)
+            aabbs[i] = p.getAABB(self._pybullet_id, link_ids[i])
+        aabb_mins = aabbs[:, 0] - distance
+        aabb_maxs = aabbs[:, 1]
+        a = np.array([link_to_index[link_a] for link_a, _ in link_combinations])
+        b = np.array([link_to_index[link_b] for _, link_b in link_combinations])
+        overlap = np.all((aabb_mins[a] <= aabb_maxs[b]) & (aabb_mins[b] <= aabb_maxs[a]), axis=1)
+        for i in np.flatnonzero(overlap):
+            if len(pw.getClosestPoints(self._pybullet_id, self._pybullet_id, distance,
+                                       link_ids[a[i]], link_ids[b[i]])) > 0:
+                in_collision.add(link_combinations[i])
+        return in_collision
+
     def in_collision(self, link_a, link_b, distance):
         link_id_a = self.get_pybullet_link_id(link_a)
         link_id_b = self.get_pybullet_link_id(link_b)
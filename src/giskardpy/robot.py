@@ -72,6 +72,15 @@ class Robot(Backend):
             joint = self.get_parent_joint_of_joint(joint)
         return joint
 
+    @memoize
+    def has_controlled_parent_joint(self, link_name):
+        joint = self.get_parent_joint_of_link(link_name)
+        while joint is not None:
+            if joint in self.controlled_joints:
+                return True
+            joint = self.get_parent_joint_of_joint(joint)
+        return False
+
     @memoize
     def get_controlled_leaf_joints(self):
         leaves = self.get_leaves()
@@ -229,14 +238,19 @@ class Robot(Backend):
         :return: 4d matrix describing the transformation from root_link to tip_link
         :rtype: spw.Matrix
         """
-        fk = w.eye(4)
-        root_chain, _, tip_chain = self.get_split_chain(root_link, tip_link, links=False)
-        for joint_name in root_chain:
-            fk = w.dot(fk, w.inverse_frame(self.get_joint_frame(joint_name)))
-        for joint_name in tip_chain:
-            fk = w.dot(fk, self.get_joint_frame(joint_name))
+        key = root_link, tip_link
+        if key not in self._fk_expressions:
+            # goals usually ask for the same root/tip several times, reusing the expression lets them share
+            # the same subgraph instead of building a new one each time
+            fk = w.eye(4)
+            root_chain, _, tip_chain = self.get_split_chain(root_link, tip_link, links=False)
+            for joint_name in root_chain:
+                fk = w.dot(fk, w.inverse_frame(self.get_joint_frame(joint_name)))
+            for joint_name in tip_chain:
+                fk = w.dot(fk, self.get_joint_frame(joint_name))
+            self._fk_expressions[key] = fk
         # FIXME there is some reference fuckup going on, but i don't know where; deepcopy is just a quick fix
-        return deepcopy(fk)
+        return deepcopy(self._fk_expressions[key])
 
     def get_fk_pose(self, root, tip):
         try:
@@ -298,10 +312,20 @@ class Robot(Backend):
         :return: minimum of default velocity limit and limit specified in urdfs
         :rtype: float
         """
-        limit = self.get_joint_velocity_limit_expr(joint_name)
-        f = w.speed_up(limit, w.free_symbols(limit))
+        f = self.get_joint_velocity_limit_function(joint_name)
         return f.call2(god_map.get_values(f.str_params))[0][0]
 
+    @memoize
+    def get_joint_velocity_limit_function(self, joint_name):
+        """
+        :param joint_name: name of the joint in the urdfs
+        :type joint_name: str
+        :return: compiled velocity limit expression, its free symbols only change when the robot is reinitialized
+        :rtype: w.CompiledFunction
+        """
+        limit = self.get_joint_velocity_limit_expr(joint_name)
+        return w.speed_up(limit, w.free_symbols(limit))
+
     def get_joint_frame(self, joint_name):
         """
         :param joint_name: name of the joint in the urdfs
@@ -355,13 +379,9 @@ class Robot(Backend):
         :type link_b: str
         :rtype: bool
         """
-        try:
-            self.get_controlled_parent_joint(link_a)
-        except KeyError:
+        if not self.has_controlled_parent_joint(link_a):
             return False
-        try:
-            self.get_controlled_parent_joint(link_b)
-        except KeyError:
+        if not self.has_controlled_parent_joint(link_b):
             return True
         return link_a < link_b
 
@@ -1,7 +1,5 @@
-import hashlib
 import warnings
 from collections import OrderedDict
-from itertools import chain
 from giskardpy.qp_problem_builder import QProblemBuilder
 from giskardpy.robot import Robot
 
@@ -70,16 +68,12 @@ class InstantaneousController(object):
 
 
     def compile(self):
-        a = ''.join(str(x) for x in sorted(chain(self.soft_constraints.keys(),
-                                                 self.hard_constraints.keys(),
-                                                 self.joint_constraints.keys())))
-        function_hash = hashlib.md5(a + self.robot.get_urdf_str()).hexdigest()
-        path_to_functions = self.path_to_functions + function_hash
+        # compiled functions are not stored on disk, no need to hash all constraint names and the urdf for a path
         self.qp_problem_builder = QProblemBuilder(self.joint_constraints,
                                                   self.hard_constraints,
                                                   self.soft_constraints,
                                                   self.joint_to_symbols_str.values(),
-                                                  path_to_functions)
+                                                  self.path_to_functions)
 
     def get_cmd(self, substitutions, nWSR=None):
         """
@@ -363,7 +363,7 @@ def msg_to_list(thing):
         thing = thing.pose
     if isinstance(thing, Vector3Stamped):
         thing = thing.vector
-    if isinstance(thing, Point) or isinstance(thing, Vector3):
+    if isinstance(thing, (Point, Vector3)):
         return [thing.x,
                 thing.y,
                 thing.z]
@@ -535,6 +535,7 @@ def render_dot_tree(root, visibility_level=common.VisibilityLevel.DETAIL, name=N
     """
     Render the dot tree to .dot, .svg, .png. files in the current
     working directory. These will be named with the root behaviour name.
+    Rendering is skipped if an identical .dot file and its .svg/.png already exist.
 
     Args:
         root (:class:`~py_trees.behaviour.Behaviour`): the root of a tree, or subtree
@@ -565,8 +566,17 @@ def render_dot_tree(root, visibility_level=common.VisibilityLevel.DETAIL, name=N
     """
     graph = generate_pydot_graph(root, visibility_level)
     filename_wo_extension = root.name.lower().replace(" ", "_") if name is None else name
+    dot_file = filename_wo_extension + '.dot'
+    if os.path.isfile(filename_wo_extension + '.png') and os.path.isfile(filename_wo_extension + '.svg'):
+        try:
+            with open(dot_file, 'r') as f:
+                if f.read() == graph.to_string():
+                    # the tree didn't change since the last run, skip the graphviz calls
+                    return
+        except IOError:
+            pass
     logging.loginfo("Writing %s.dot/svg/png" % filename_wo_extension)
-    graph.write(filename_wo_extension + '.dot')
+    graph.write(dot_file)
     graph.write_png(filename_wo_extension + '.png')
     graph.write_svg(filename_wo_extension + '.svg')
 
@@ -185,11 +185,12 @@ class World(object):
         collision_matrix = self.robot.get_self_collision_matrix()
         collision_matrix2 = {}
         for link1, link2 in collision_matrix:
-            # FIXME should I use the minimum of both distances?
+            # the cut off has to cover the thresholds of both links, independent of the order of the pair
+            distance = max(min_dist[link1], min_dist[link2])
             if self.robot.link_order(link1, link2):
-                collision_matrix2[link1, robot_name, link2] = min_dist[link1]
+                collision_matrix2[link1, robot_name, link2] = distance
             else:
-                collision_matrix2[link2, robot_name, link1] = min_dist[link1]
+                collision_matrix2[link2, robot_name, link1] = distance
         return collision_matrix2
 
     def collision_goals_to_collision_matrix(self, collision_goals, min_dist):
@@ -301,26 +302,21 @@ class World(object):
                             u'link b \'{}\' of body \'{}\' unknown'.format(link_b, collision_entry.body_b))
 
     def split_link_bs(self, collision_goals):
-        # FIXME remove the side effects of these three methods
-        i = 0
-        while i < len(collision_goals):
-            collision_entry = collision_goals[i]
+        result = []
+        for i, collision_entry in enumerate(collision_goals):
             if self.is_avoid_all_self_collision(collision_entry):
-                i += 1
+                result.append(collision_entry)
                 continue
             if self.all_link_bs(collision_entry):
                 if collision_entry.body_b == self.robot.get_name():
-                    new_ces = []
                     link_bs = self.robot.get_possible_collisions(list(collision_entry.robot_links)[0])
-                elif [x for x in collision_goals[i:] if
-                      x.robot_links == collision_entry.robot_links and
-                      x.body_b == collision_entry.body_b and not self.all_link_bs(x)]:
-                    new_ces = []
+                elif any(x.robot_links == collision_entry.robot_links and
+                         x.body_b == collision_entry.body_b and not self.all_link_bs(x)
+                         for x in collision_goals[i:]):
                     link_bs = self.get_object(collision_entry.body_b).get_link_names_with_collision()
                 else:
-                    i += 1
+                    result.append(collision_entry)
                     continue
-                collision_goals.remove(collision_entry)
                 for link_b in link_bs:
                     ce = CollisionEntry()
                     ce.type = collision_entry.type
@@ -328,13 +324,8 @@ class World(object):
                     ce.body_b = collision_entry.body_b
                     ce.min_dist = collision_entry.min_dist
                     ce.link_bs = [link_b]
-                    new_ces.append(ce)
-                for new_ce in new_ces:
-                    collision_goals.insert(i, new_ce)
-                i += len(new_ces)
-                continue
+                    result.append(ce)
             elif len(collision_entry.link_bs) > 1:
-                collision_goals.remove(collision_entry)
                 for link_b in collision_entry.link_bs:
                     ce = CollisionEntry()
                     ce.type = collision_entry.type
@@ -342,59 +333,39 @@ class World(object):
                     ce.body_b = collision_entry.body_b
                     ce.link_bs = [link_b]
                     ce.min_dist = collision_entry.min_dist
-                    collision_goals.insert(i, ce)
-                i += len(collision_entry.link_bs)
-                continue
-            i += 1
-        return collision_goals
+                    result.append(ce)
+            else:
+                result.append(collision_entry)
+        return result
 
     def robot_related_stuff(self, collision_goals):
-        i = 0
+        result = []
         controlled_robot_links = self.robot.get_controlled_links()
-        while i < len(collision_goals):
-            collision_entry = collision_goals[i]
+        for collision_entry in collision_goals:
             if self.is_avoid_all_self_collision(collision_entry):
-                i += 1
+                result.append(collision_entry)
                 continue
             if self.all_robot_links(collision_entry):
-                collision_goals.remove(collision_entry)
-
-                new_ces = []
-                for robot_link in controlled_robot_links:
-                    ce = CollisionEntry()
-                    ce.type = collision_entry.type
-                    ce.robot_links = [robot_link]
-                    ce.body_b = collision_entry.body_b
-                    ce.min_dist = collision_entry.min_dist
-                    ce.link_bs = collision_entry.link_bs
-                    new_ces.append(ce)
-
-                for new_ce in new_ces:
-                    collision_goals.insert(i, new_ce)
-                i += len(new_ces)
-                continue
+                robot_links = controlled_robot_links
             elif len(collision_entry.robot_links) > 1:
-                collision_goals.remove(collision_entry)
-                for robot_link in collision_entry.robot_links:
-                    ce = CollisionEntry()
-                    ce.type = collision_entry.type
-                    ce.robot_links = [robot_link]
-                    ce.body_b = collision_entry.body_b
-                    ce.min_dist = collision_entry.min_dist
-                    ce.link_bs = collision_entry.link_bs
-                    collision_goals.insert(i, ce)
-                i += len(collision_entry.robot_links)
+                robot_links = collision_entry.robot_links
+            else:
+                result.append(collision_entry)
                 continue
-            i += 1
-        return collision_goals
+            for robot_link in robot_links:
+                ce = CollisionEntry()
+                ce.type = collision_entry.type
+                ce.robot_links = [robot_link]
+                ce.body_b = collision_entry.body_b
+                ce.min_dist = collision_entry.min_dist
+                ce.link_bs = collision_entry.link_bs
+                result.append(ce)
+        return result
 
     def split_body_b(self, collision_goals):
-        i = 0
-        while i < len(collision_goals):
-            collision_entry = collision_goals[i]
+        result = []
+        for collision_entry in collision_goals:
             if self.all_body_bs(collision_entry):
-                collision_goals.remove(collision_entry)
-                new_ces = []
                 for body_b in [self.robot.get_name()] + self.get_object_names():
                     ce = CollisionEntry()
                     ce.type = collision_entry.type
@@ -402,13 +373,10 @@ class World(object):
                     ce.min_dist = collision_entry.min_dist
                     ce.body_b = body_b
                     ce.link_bs = collision_entry.link_bs
-                    new_ces.append(ce)
-                for new_ce in reversed(new_ces):
-                    collision_goals.insert(i, new_ce)
-                i += len(new_ces)
-                continue
-            i += 1
-        return collision_goals
+                    result.append(ce)
+            else:
+                result.append(collision_entry)
+        return result
 
     def all_robot_links(self, collision_entry):
         return CollisionEntry.ALL in collision_entry.robot_links and len(collision_entry.robot_links) == 1
@@ -431,9 +399,10 @@ class World(object):
         :type collision_entry: CollisionEntry
         :return: bool
         """
-        return self.is_avoid_collision(collision_entry) \
+        # body_b check first, it is the cheapest and rules out all entries for world objects
+        return collision_entry.body_b == self.robot.get_name() \
+               and self.is_avoid_collision(collision_entry) \
                and self.all_robot_links(collision_entry) \
-               and collision_entry.body_b == self.robot.get_name() \
                and self.all_link_bs(collision_entry)
 
     def is_allow_all_self_collision(self, collision_entry):
@@ -3,11 +3,11 @@ import hashlib
 import numpy as np
 import os
 import pickle
+from collections import defaultdict
 from itertools import product, combinations
 from time import time
 
 from geometry_msgs.msg import Pose, Quaternion
-from tf.transformations import euler_from_quaternion, rotation_from_matrix, quaternion_matrix
 
 from giskardpy import logging
 from giskardpy.data_types import SingleJointState
@@ -24,11 +24,11 @@ class WorldObject(URDFObject):
         if not ignored_pairs:
             self.ignored_pairs = set()
         else:
-            self.ignored_pairs = {tuple(x) for x in ignored_pairs}
+            self.ignored_pairs = {tuple(sorted(x)) for x in ignored_pairs}
         if not added_pairs:
             self.added_pairs = set()
         else:
-            self.added_pairs = {tuple(x) for x in added_pairs}
+            self.added_pairs = {tuple(sorted(x)) for x in added_pairs}
         self._calc_self_collision_matrix = calc_self_collision_matrix
         if base_pose is None:
             p = Pose()
@@ -38,6 +38,7 @@ class WorldObject(URDFObject):
         self._js = self.get_zero_joint_state()
         self._controlled_links = None
         self._self_collision_matrix = set()
+        self._possible_collisions = None
 
     @property
     def joint_state(self):
@@ -106,8 +107,8 @@ class WorldObject(URDFObject):
 
     def calc_collision_matrix(self, link_combinations=None, d=0.05, d2=0.0, num_rnd_tries=2000):
         """
-        :param link_combinations: set with link name tuples
-        :type link_combinations: set
+        :param link_combinations: iterable of link name tuples, (a, b) and (b, a) are treated as the same pair
+        :type link_combinations: iterable
         :param d: distance threshold to detect links that are always in collision
         :type d: float
         :param d2: distance threshold to find links that are sometimes in collision
@@ -122,44 +123,45 @@ class WorldObject(URDFObject):
         t = time()
         np.random.seed(1337)
         always = set()
+        link_combinations = {tuple(sorted(x)) for x in link_combinations}
 
         # find meaningless self-collisions
         for link_a, link_b in link_combinations:
             if self.are_linked(link_a, link_b) or link_a == link_b:
                 always.add((link_a, link_b))
-        always = always.union(self.ignored_pairs)
+        always.update(self.ignored_pairs)
         rest = link_combinations.difference(always)
         self.joint_state = self.get_zero_joint_state()
-        always = always.union(self.check_collisions(rest, d))
-        rest = rest.difference(always)
+        always.update(self.check_collisions(rest, d))
+        rest.difference_update(always)
 
         # find meaningful self-collisions
         self.joint_state = self.get_min_joint_state()
         sometimes = self.check_collisions(rest, d2)
-        rest = rest.difference(sometimes)
+        rest.difference_update(sometimes)
         self.joint_state = self.get_max_joint_state()
         sometimes2 = self.check_collisions(rest, d2)
-        rest = rest.difference(sometimes2)
-        sometimes = sometimes.union(sometimes2)
+        rest.difference_update(sometimes2)
+        sometimes.update(sometimes2)
         for i in range(num_rnd_tries):
+            if not rest:
+                break
             self.joint_state = self.get_rnd_joint_state()
             sometimes2 = self.check_collisions(rest, d2)
             if len(sometimes2) > 0:
-                rest = rest.difference(sometimes2)
-                sometimes = sometimes.union(sometimes2)
-        sometimes = sometimes.union(self.added_pairs)
+                rest.difference_update(sometimes2)
+                sometimes.update(sometimes2)
+        sometimes.update(self.added_pairs)
         logging.loginfo(u'calculated self collision matrix in {:.3f}s'.format(time() - t))
         return sometimes
 
     def get_possible_collisions(self, link):
-        # TODO speed up by saving this
-        possible_collisions = set()
-        for link1, link2 in self.get_self_collision_matrix():
-            if link == link1:
-                possible_collisions.add(link2)
-            elif link == link2:
-                possible_collisions.add(link1)
-        return possible_collisions
+        if self._possible_collisions is None:
+            self._possible_collisions = defaultdict(set)
+            for link1, link2 in self.get_self_collision_matrix():
+                self._possible_collisions[link1].add(link2)
+                self._possible_collisions[link2].add(link1)
+        return set(self._possible_collisions.get(link, ()))
 
     def check_collisions(self, link_combinations, distance):
         in_collision = set()
@@ -218,17 +220,18 @@ class WorldObject(URDFObject):
         return js
 
     def add_self_collision_entries(self, object_name):
-        link_pairs = {(object_name, link_name) for link_name in self.get_link_names()}
-        link_pairs.remove((object_name, object_name))
+        link_pairs = ((object_name, link_name) for link_name in self.get_link_names() if link_name != object_name)
         self_collision_with_object = self.calc_collision_matrix(link_pairs)
         self._self_collision_matrix.update(self_collision_with_object)
+        self._possible_collisions = None
 
     def remove_self_collision_entries(self, object_name):
         self._self_collision_matrix = {(link1, link2) for link1, link2 in self.get_self_collision_matrix()
                                        if link1 != object_name and link2 != object_name}
+        self._possible_collisions = None
 
     def init_self_collision_matrix(self):
-        self.update_self_collision_matrix(added_links=set(combinations(self.get_link_names_with_collision(), 2)))
+        self.update_self_collision_matrix(added_links=combinations(self.get_link_names_with_collision(), 2))
 
     def update_self_collision_matrix(self, added_links=None, removed_links=None):
         if not self.load_self_collision_matrix(self.path_to_data_folder):
@@ -236,9 +239,12 @@ class WorldObject(URDFObject):
                 added_links = set()
             if removed_links is None:
                 removed_links = set()
+            else:
+                removed_links = set(removed_links)
             self._self_collision_matrix = {x for x in self._self_collision_matrix if x[0] not in removed_links and
                                            x[1] not in removed_links}
             self._self_collision_matrix.update(self.calc_collision_matrix(added_links))
+            self._possible_collisions = None
             self.safe_self_collision_matrix(self.path_to_data_folder)
 
     def load_self_collision_matrix(self, path):
@@ -249,7 +255,9 @@ class WorldObject(URDFObject):
         path = u'{}/{}/{}'.format(path, self.get_name(), urdf_hash)
         if os.path.isfile(path):
             with open(path) as f:
-                self._self_collision_matrix = pickle.load(f)
+                # matrices saved before pairs were stored sorted may contain (b, a) instead of (a, b)
+                self._self_collision_matrix = {tuple(sorted(x)) for x in pickle.load(f)}
+                self._possible_collisions = None
                 logging.loginfo(u'loaded self collision matrix {}'.format(path))
                 return True
         return False
@@ -276,8 +284,8 @@ class WorldObject(URDFObject):
 
     def attach_urdf_object(self, urdf_object, parent_link, pose):
         super(WorldObject, self).attach_urdf_object(urdf_object, parent_link, pose)
-        self.update_self_collision_matrix(added_links=set(product(self.get_links_with_collision(),
-                                                                  urdf_object.get_links_with_collision())))
+        self.update_self_collision_matrix(added_links=product(self.get_links_with_collision(),
+                                                              urdf_object.get_links_with_collision()))
         # TODO set joint state for controllable joints of added urdf?
 
     def detach_sub_tree(self, joint_name):
@@ -35,6 +35,15 @@ class TestCASWrapper(unittest.TestCase):
 
                 assert w.equivalent(jac[i,j], expected[i,j])
 
+    def test_matrix_of_expressions(self):
+        a = w.Symbol('a')
+        b = w.Symbol('b')
+        m = w.Matrix([a, 1, a*b])
+        self.assertEqual(m.shape, (3, 1))
+        assert w.equivalent(m[0], a)
+        assert w.equivalent(m[1], 1)
+        assert w.equivalent(m[2], a*b)
+
     @given(float_no_nan_no_inf())
     def test_abs(self, f1):
         self.assertAlmostEqual(w.compile_and_execute(w.Abs, [f1]), abs(f1), places=7)
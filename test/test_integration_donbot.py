@@ -53,6 +53,8 @@ self_collision_js = {
 
 folder_name = u'tmp_data/'
 
+pitch_90 = quaternion_about_axis(np.pi / 2, [0, 1, 0])
+
 
 @pytest.fixture(scope=u'module')
 def ros(request):
@@ -631,28 +633,28 @@ class TestCollisionAvoidanceGoals(object):
         p.pose.position.x = 0
         p.pose.position.z = 0.25
         p.pose.position.y = 0.04
-        p.pose.orientation = Quaternion(*quaternion_about_axis(np.pi / 2, [0, 1, 0]))
+        p.pose.orientation = Quaternion(*pitch_90)
         better_pose.add_cylinder('fdown', [0.2, 0.01], p)
         p = PoseStamped()
         p.header.frame_id = better_pose.gripper_tip
         p.pose.position.x = 0
         p.pose.position.z = 0.25
         p.pose.position.y = -0.07
-        p.pose.orientation = Quaternion(*quaternion_about_axis(np.pi / 2, [0, 1, 0]))
+        p.pose.orientation = Quaternion(*pitch_90)
         better_pose.add_cylinder('fup', [0.2, 0.01], p)
         p = PoseStamped()
         p.header.frame_id = better_pose.gripper_tip
         p.pose.position.x = 0
         p.pose.position.z = 0.15
         p.pose.position.y = 0.07
-        p.pose.orientation = Quaternion(*quaternion_about_axis(np.pi / 2, [0, 1, 0]))
+        p.pose.orientation = Quaternion(*pitch_90)
         better_pose.add_cylinder('bdown', [0.2, 0.01], p)
         p = PoseStamped()
         p.header.frame_id = better_pose.gripper_tip
         p.pose.position.x = 0
         p.pose.position.z = 0.15
         p.pose.position.y = -0.04
-        p.pose.orientation = Quaternion(*quaternion_about_axis(np.pi / 2, [0, 1, 0]))
+        p.pose.orientation = Quaternion(*pitch_90)
         better_pose.add_cylinder('bup', [0.2, 0.01], p)
 
         better_pose.send_and_check_goal()
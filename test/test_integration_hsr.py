@@ -1,4 +1,3 @@
-from copy import deepcopy
 import numpy as np
 import pytest
 import rospy
@@ -26,6 +25,26 @@ default_pose = {
 
 folder_name = u'tmp_data/'
 
+yaw_180 = quaternion_about_axis(pi, [0, 0, 1])
+grasp_from_front = quaternion_from_matrix([[0, 0, 1, 0],
+                                           [0, -1, 0, 0],
+                                           [1, 0, 0, 0],
+                                           [0, 0, 0, 1]])
+
+
+def make_pose_stamped(frame_id, position=(0, 0, 0), orientation=(0, 0, 0, 1)):
+    """
+    :type frame_id: str
+    :param position: x, y, z
+    :param orientation: x, y, z, w
+    :rtype: PoseStamped
+    """
+    p = PoseStamped()
+    p.header.frame_id = frame_id
+    p.pose.position = Point(*position)
+    p.pose.orientation = Quaternion(*orientation)
+    return p
+
 
 @pytest.fixture(scope=u'module')
 def ros(request):
@@ -65,10 +84,7 @@ def resetted_giskard(giskard):
     """
     logging.loginfo(u'resetting giskard')
     giskard.clear_world()
-    base_goal = PoseStamped()
-    base_goal.header.frame_id = u'map'
-    base_goal.pose.orientation.w = 1
-    giskard.move_base(base_goal)
+    giskard.move_base(make_pose_stamped(u'map'))
     giskard.close_gripper()
     return giskard
 
@@ -90,22 +106,14 @@ def box_setup(zero_pose):
     :type pocky_pose_setup: PR2
     :rtype: PR2
     """
-    p = PoseStamped()
-    p.header.frame_id = u'map'
-    p.pose.position.x = 1.2
-    p.pose.position.y = 0
-    p.pose.position.z = 0.1
-    p.pose.orientation.w = 1
+    p = make_pose_stamped(u'map', position=(1.2, 0, 0.1))
     zero_pose.add_box(size=[1, 1, 1], pose=p)
     return zero_pose
 
 
 class TestJointGoals(object):
     def test_move_base(self, zero_pose):
-        p = PoseStamped()
-        p.header.frame_id = u'map'
-        p.pose.position.y = -1
-        p.pose.orientation = Quaternion(0, 0, 0.47942554, 0.87758256)
+        p = make_pose_stamped(u'map', position=(0, -1, 0), orientation=(0, 0, 0.47942554, 0.87758256))
         zero_pose.move_base(p)
 
 
@@ -115,9 +123,7 @@ class TestCartGoals(object):
         """
         :type zero_pose: HSR
         """
-        r_goal = PoseStamped()
-        r_goal.header.frame_id = zero_pose.tip
-        r_goal.pose.orientation = Quaternion(*quaternion_about_axis(pi, [0, 0, 1]))
+        r_goal = make_pose_stamped(zero_pose.tip, orientation=yaw_180)
         zero_pose.set_and_check_cart_goal(r_goal, zero_pose.tip)
 
 
@@ -127,10 +133,7 @@ class TestCollisionAvoidanceGoals(object):
         """
         :type zero_pose: HSR
         """
-        r_goal = PoseStamped()
-        r_goal.header.frame_id = zero_pose.tip
-        r_goal.pose.position.z = 0.5
-        r_goal.pose.orientation.w = 1
+        r_goal = make_pose_stamped(zero_pose.tip, position=(0, 0, 0.5))
         zero_pose.set_and_check_cart_goal(r_goal, zero_pose.tip)
 
     def test_self_collision_avoidance2(self, zero_pose):
@@ -148,10 +151,7 @@ class TestCollisionAvoidanceGoals(object):
         }
         zero_pose.send_and_check_joint_goal(js)
 
-        goal_pose = PoseStamped()
-        goal_pose.header.frame_id = u'hand_palm_link'
-        goal_pose.pose.position.x = 0.5
-        goal_pose.pose.orientation.w = 1
+        goal_pose = make_pose_stamped(u'hand_palm_link', position=(0.5, 0, 0))
         zero_pose.set_and_check_cart_goal(goal_pose, zero_pose.tip)
 
     def test_attached_collision1(self, box_setup):
@@ -159,27 +159,16 @@ class TestCollisionAvoidanceGoals(object):
         :type box_setup: HSR
         """
         box_name = u'asdf'
-        box_pose = PoseStamped()
-        box_pose.header.frame_id = u'map'
-        box_pose.pose.position = Point(0.85, 0.3, .66)
-        box_pose.pose.orientation = Quaternion(0, 0, 0, 1)
+        box_pose = make_pose_stamped(u'map', position=(0.85, 0.3, .66))
 
         box_setup.add_box(box_name, [0.07, 0.04, 0.1], box_pose)
         box_setup.open_gripper()
 
-        grasp_pose = deepcopy(box_pose)
-        grasp_pose.pose.position.x -= 0.05
-        grasp_pose.pose.orientation = Quaternion(*quaternion_from_matrix([[0, 0, 1, 0],
-                                                                          [0, -1, 0, 0],
-                                                                          [1, 0, 0, 0],
-                                                                          [0, 0, 0, 1]]))
+        grasp_pose = make_pose_stamped(u'map', position=(0.8, 0.3, .66), orientation=grasp_from_front)
         box_setup.set_and_check_cart_goal(grasp_pose, box_setup.tip)
         box_setup.attach_existing(box_name, box_setup.tip)
 
-        base_goal = PoseStamped()
-        base_goal.header.frame_id = box_setup.default_root
-        base_goal.pose.position.x -= 1
-        base_goal.pose.orientation.w = 1
+        base_goal = make_pose_stamped(box_setup.default_root, position=(-1, 0, 0))
         box_setup.move_base(base_goal)
 
     def test_collision_avoidance(self, zero_pose):
@@ -189,12 +178,7 @@ class TestCollisionAvoidanceGoals(object):
         js = {u'arm_flex_joint': -np.pi/2}
         zero_pose.send_and_check_joint_goal(js)
 
-        p = PoseStamped()
-        p.header.frame_id = u'map'
-        p.pose.position.x = 0.9
-        p.pose.position.y = 0
-        p.pose.position.z = 0.5
-        p.pose.orientation.w = 1
+        p = make_pose_stamped(u'map', position=(0.9, 0, 0.5))
         zero_pose.add_box(size=[1, 1, 0.01], pose=p)
 
         js = {u'arm_flex_joint': 0}
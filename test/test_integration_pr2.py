@@ -115,6 +115,9 @@ pick_up_pose = {
 
 folder_name = u'tmp_data/'
 
+yaw_0 = quaternion_about_axis(0, [0, 0, 1])
+yaw_180 = quaternion_about_axis(pi, [0, 0, 1])
+
 
 @pytest.fixture(scope=u'module')
 def ros(request):
@@ -5226,7 +5229,7 @@ class TestCollisionAvoidanceGoals(object):
         r_goal.header.frame_id = kitchen_setup.l_tip
         r_goal.pose.position.x = 0.05
         r_goal.pose.position.y = -0.08
-        r_goal.pose.orientation = Quaternion(*quaternion_about_axis(np.pi, [0, 0, 1]))
+        r_goal.pose.orientation = Quaternion(*yaw_180)
         # kitchen_setup.allow_all_collisions()
         kitchen_setup.set_cart_goal(r_goal,
                                     tip_link=kitchen_setup.r_tip,
@@ -5816,7 +5819,7 @@ class TestCollisionAvoidanceGoals(object):
         p = PoseStamped()
         p.header.frame_id = box_setup.default_root
         p.pose.position.x += 0.5
-        p.pose.orientation = Quaternion(*quaternion_about_axis(np.pi, [0, 0, 1]))
+        p.pose.orientation = Quaternion(*yaw_180)
         box_setup.teleport_base(p)
         # ce = CollisionEntry()
         # ce.type = CollisionEntry.AVOID_COLLISION
@@ -6032,7 +6035,7 @@ class TestCollisionAvoidanceGoals(object):
         base_pose.header.frame_id = u'map'
         base_pose.pose.position.x = 0.8
         base_pose.pose.position.y = 1
-        base_pose.pose.orientation = Quaternion(*quaternion_about_axis(0, [0, 0, 1]))
+        base_pose.pose.orientation = Quaternion(*yaw_0)
         kitchen_setup.teleport_base(base_pose)
         base_pose = PoseStamped()
         base_pose.header.frame_id = u'map'
@@ -6053,7 +6056,7 @@ class TestCollisionAvoidanceGoals(object):
         base_pose.pose.position.y = 0.9
         base_pose.pose.orientation = Quaternion(*quaternion_about_axis(np.pi / 2, [0, 0, 1]))
         kitchen_setup.teleport_base(base_pose)
-        base_pose.pose.orientation = Quaternion(*quaternion_about_axis(np.pi, [0, 0, 1]))
+        base_pose.pose.orientation = Quaternion(*yaw_180)
         kitchen_setup.set_joint_goal(gaya_pose)
         kitchen_setup.set_and_check_cart_goal(base_pose, u'base_footprint', expected_error_codes=[MoveResult.SHAKING])
         kitchen_setup.check_joint_state(gaya_pose)
@@ -6066,7 +6069,7 @@ class TestCollisionAvoidanceGoals(object):
         base_pose.header.frame_id = u'map'
         base_pose.pose.position.x = 0.8
         base_pose.pose.position.y = 0.9
-        base_pose.pose.orientation = Quaternion(*quaternion_about_axis(0, [0, 0, 1]))
+        base_pose.pose.orientation = Quaternion(*yaw_0)
         kitchen_setup.teleport_base(base_pose)
         base_pose = PoseStamped()
         base_pose.header.frame_id = u'map'
@@ -6086,12 +6089,12 @@ class TestCollisionAvoidanceGoals(object):
         base_pose.header.frame_id = u'map'
         base_pose.pose.position.x = 0
         base_pose.pose.position.y = 1.5
-        base_pose.pose.orientation = Quaternion(*quaternion_about_axis(np.pi, [0, 0, 1]))
+        base_pose.pose.orientation = Quaternion(*yaw_180)
         kitchen_setup.teleport_base(base_pose)
         base_pose = PoseStamped()
         base_pose.header.frame_id = tip
         base_pose.pose.position.x = 2.3
-        base_pose.pose.orientation = Quaternion(*quaternion_about_axis(0, [0, 0, 1]))
+        base_pose.pose.orientation = Quaternion(*yaw_0)
 
         avoidance_hint = Vector3Stamped()
         avoidance_hint.header.frame_id = u'map'
@@ -6119,13 +6122,13 @@ class TestCollisionAvoidanceGoals(object):
         base_pose.header.frame_id = u'map'
         base_pose.pose.position.x = 0
         base_pose.pose.position.y = 1.5
-        base_pose.pose.orientation = Quaternion(*quaternion_about_axis(0, [0, 0, 1]))
+        base_pose.pose.orientation = Quaternion(*yaw_0)
         kitchen_setup.teleport_base(base_pose)
         base_pose = PoseStamped()
         base_pose.header.frame_id = tip
         base_pose.pose.position.x = 1
         base_pose.pose.position.y = 0
-        base_pose.pose.orientation = Quaternion(*quaternion_about_axis(0, [0, 0, 1]))
+        base_pose.pose.orientation = Quaternion(*yaw_0)
 
         avoidance_hint = Vector3Stamped()
         avoidance_hint.header.frame_id = u'map'
@@ -7033,7 +7036,7 @@ class TestCollisionAvoidanceGoals(object):
         base_goal = PoseStamped()
         base_goal.header.frame_id = u'base_footprint'
         base_goal.pose.position.x = -.1
-        base_goal.pose.orientation = Quaternion(*quaternion_about_axis(pi, [0, 0, 1]))
+        base_goal.pose.orientation = Quaternion(*yaw_180)
         kitchen_setup.teleport_base(base_goal)
 
         # place bowl and cup
@@ -1,6 +1,6 @@
 import shutil
 from collections import defaultdict
-from itertools import product
+from itertools import product, combinations
 
 import pybullet as p
 import pytest
@@ -13,7 +13,7 @@ from giskardpy.pybullet_world_object import PyBulletWorldObject
 from giskardpy.robot import Robot
 from giskardpy.utils import make_world_body_box, make_world_body_sphere, make_world_body_cylinder
 from giskardpy.world_object import WorldObject
-from utils_for_tests import pr2_urdf, base_bot_urdf, donbot_urdf
+from utils_for_tests import pr2_urdf, base_bot_urdf, donbot_urdf, pr2_without_base_urdf
 
 # this import has to come last
 import test_world
@@ -95,6 +95,19 @@ class TestPyBulletWorldObject(test_world.TestWorldObj):
         assert_num_pybullet_objects(1)
         assert u'pointy' in pbw.get_body_names()
 
+    def test_check_collisions(self, function_setup):
+        r = self.cls(pr2_without_base_urdf())
+        root = r.get_root()
+        assert r.get_pybullet_link_id(root) == -1
+        link_combinations = list(combinations(r.get_link_names_with_collision(), 2))
+        assert any(root in link_pair for link_pair in link_combinations)
+        for joint_state in [r.get_zero_joint_state(), r.get_min_joint_state(), r.get_max_joint_state()]:
+            r.joint_state = joint_state
+            for distance in [0.0, 0.05]:
+                expected = {(link_a, link_b) for link_a, link_b in link_combinations
+                            if r.in_collision(link_a, link_b, distance)}
+                assert r.check_collisions(link_combinations, distance) == expected
+
 
 class TestPyBulletRobot(test_world.TestRobot):
     cls = Robot
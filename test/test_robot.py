@@ -253,6 +253,15 @@ class TestSymengineController(object):
 
         assert set(parsed_boxy.get_joint_names_controllable()).difference(expected) == set()
 
+    def test_has_controlled_parent_joint_pr2(self, parsed_pr2):
+        assert not parsed_pr2.has_controlled_parent_joint(parsed_pr2.get_root())
+        assert parsed_pr2.has_controlled_parent_joint(u'r_gripper_tool_frame')
+
+    def test_link_order_pr2(self, parsed_pr2):
+        root = parsed_pr2.get_root()
+        assert parsed_pr2.link_order(u'r_gripper_tool_frame', root)
+        assert not parsed_pr2.link_order(root, u'r_gripper_tool_frame')
+
 
 if __name__ == '__main__':
     import rosunit
@@ -122,6 +122,15 @@ class TestWorldObj(test_urdf_object.TestUrdfObject):
         r.load_self_collision_matrix(test_folder)
         assert scm_with_obj == r.get_self_collision_matrix()
 
+    def test_load_unsorted_collision_matrix(self, test_folder, delete_test_folder):
+        r = self.cls(donbot_urdf(), path_to_data_folder=test_folder)
+        r.init_self_collision_matrix()
+        scm = r.get_self_collision_matrix()
+        r._self_collision_matrix = {(link_b, link_a) for link_a, link_b in scm}
+        r.safe_self_collision_matrix(test_folder)
+        r.load_self_collision_matrix(test_folder)
+        assert scm == r.get_self_collision_matrix()
+
     def test_base_pose1(self, function_setup):
         parsed_pr2 = self.cls(pr2_urdf())
         p = Pose()
@@ -91,19 +91,13 @@ def compare_poses(pose1, pose2, decimal=2):
     :type pose1: Pose
     :type pose2: Pose
     """
-    np.testing.assert_almost_equal(pose1.position.x, pose2.position.x, decimal=decimal)
-    np.testing.assert_almost_equal(pose1.position.y, pose2.position.y, decimal=decimal)
-    np.testing.assert_almost_equal(pose1.position.z, pose2.position.z, decimal=decimal)
+    np.testing.assert_array_almost_equal(msg_to_list(pose1.position), msg_to_list(pose2.position), decimal=decimal)
+    q1 = np.array(msg_to_list(pose1.orientation))
+    q2 = np.array(msg_to_list(pose2.orientation))
     try:
-        np.testing.assert_almost_equal(pose1.orientation.x, pose2.orientation.x, decimal=decimal)
-        np.testing.assert_almost_equal(pose1.orientation.y, pose2.orientation.y, decimal=decimal)
-        np.testing.assert_almost_equal(pose1.orientation.z, pose2.orientation.z, decimal=decimal)
-        np.testing.assert_almost_equal(pose1.orientation.w, pose2.orientation.w, decimal=decimal)
-    except:
-        np.testing.assert_almost_equal(pose1.orientation.x, -pose2.orientation.x, decimal=decimal)
-        np.testing.assert_almost_equal(pose1.orientation.y, -pose2.orientation.y, decimal=decimal)
-        np.testing.assert_almost_equal(pose1.orientation.z, -pose2.orientation.z, decimal=decimal)
-        np.testing.assert_almost_equal(pose1.orientation.w, -pose2.orientation.w, decimal=decimal)
+        np.testing.assert_array_almost_equal(q1, q2, decimal=decimal)
+    except AssertionError:
+        np.testing.assert_array_almost_equal(q1, -q2, decimal=decimal)
 
 
 @composite